@@ -1,6 +1,6 @@
 from src.core.storage import JobStorage
 from src.core.pagination import PaginationParser, create_pagination_parser
 from src.core.job_crawler import JobCrawlerBase, TopCVCrawler, create_crawler
-from src.core.http_client import RateLimitedClient, retry_with_backoff
+from src.core.http_client import RateLimitedClient, retry_with_backoff, get_client
 from src.core.crawler_engine import CrawlerEngine, crawl_once, crawl_continuously
 from src.core.interfaces import CrawlerInterface, ParserInterface, PaginationInterface, StorageInterface
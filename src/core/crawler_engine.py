@@ -1,12 +1,16 @@
 import time
 import logging
+import functools
+import collections
 
 from datetime import datetime
-from typing import Dict, Any, NoReturn
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Dict, List, Set, Any, Optional, NoReturn, Deque, Tuple
 
 from src.core.storage import JobStorage
 from src.core.job_crawler import create_crawler
-from src.utils.signal_handler import get_exit_flag
+from src.core.interfaces import CrawlerInterface
+from src.utils.signal_handler import get_exit_flag, wait_for_exit_signal
 
 
 class CrawlerEngine:
@@ -16,13 +20,32 @@ class CrawlerEngine:
         self.logger = logging.getLogger(__name__)
         self.max_runtime = config['runtime']['max_runtime']
         self.sleep_interval = config['crawling']['sleep_interval']
+        self.detail_workers = config['crawling'].get('detail_workers', 8)
+        self.early_stop_threshold = config['crawling'].get('early_stop_threshold', 20)
         
-    def crawl_once(self, crawl_all_pages: bool = False) -> int:
+    def crawl_once(self, crawl_all_pages: bool = False, storage: Optional[JobStorage] = None,
+                   crawler: Optional[CrawlerInterface] = None) -> int:
         self.logger.info(f"Starting crawl cycle at {datetime.now().isoformat()}")
-        
-        storage = JobStorage(self.config)
-        crawler = create_crawler(self.site, self.config)
 
+        owns_crawler = crawler is None
+        owns_storage = storage is None
+
+        if owns_crawler:
+            crawler = create_crawler(self.site, self.config)
+
+        if owns_storage:
+            storage = JobStorage(self.config)
+
+        try:
+            return self._crawl_pages(crawler, storage, crawl_all_pages)
+        finally:
+            if owns_crawler:
+                crawler.close()
+
+            if owns_storage:
+                storage.close()
+
+    def _crawl_pages(self, crawler: CrawlerInterface, storage: JobStorage, crawl_all_pages: bool) -> int:
         if storage.is_first_run():
             self.logger.info("First run detected - will crawl all available pages")
             crawl_all_pages = True
@@ -31,38 +54,95 @@ class CrawlerEngine:
         
         page = 1
         new_jobs_count = 0
+        consecutive_seen = 0
         start_time = time.time()
         has_more_pages = True
 
-        while (page <= pages_to_scan and has_more_pages and 
-               not self._should_stop_crawling(start_time)):
-            
-            job_listings, more_pages = crawler.get_job_listings(page)
-            has_more_pages = more_pages
-            
-            if not job_listings:
-                self.logger.info(f"No jobs found on page {page}. Ending crawl cycle.")
-                break
-            
-            for job in job_listings:
-                if get_exit_flag():
+        fetch_details = functools.partial(self._fetch_job_details, crawler)
+        pending_details: Deque[Future] = collections.deque()
+        scheduled_ids: Set[str] = set()
+
+        with ThreadPoolExecutor(max_workers=self.detail_workers) as executor:
+            pending_listings = executor.submit(crawler.get_job_listings, page)
+
+            while (page <= pages_to_scan and has_more_pages and 
+                   not self._should_stop_crawling(start_time)):
+                
+                job_listings, more_pages = pending_listings.result()
+                has_more_pages = more_pages
+                
+                if not job_listings:
+                    self.logger.info(f"No jobs found on page {page}. Ending crawl cycle.")
                     break
-                    
-                detailed_job = crawler.get_job_details(job)
+
+                new_listings, consecutive_seen, reached_seen_jobs = self._filter_new_listings(
+                    storage, job_listings, scheduled_ids, consecutive_seen
+                )
+                stop_early = reached_seen_jobs and not crawl_all_pages
+
+                if has_more_pages and page < pages_to_scan and not stop_early:
+                    pending_listings = executor.submit(crawler.get_job_listings, page + 1)
                 
-                if detailed_job and storage.save_job(detailed_job):
-                    new_jobs_count += 1
-            
-            if has_more_pages:
-                page += 1
-                self._log_pagination_status(page, pages_to_scan, crawl_all_pages)
-            else:
-                self.logger.info(f"No more pages available after page {page}. Stopping crawl cycle.")
-                break
+                if len(new_listings) < len(job_listings):
+                    self.logger.info(f"Skipping {len(job_listings) - len(new_listings)} already saved jobs on page {page}")
+                
+                pending_details.extend(executor.submit(fetch_details, job) for job in new_listings)
+                new_jobs_count += self._save_fetched_details(storage, pending_details, self.detail_workers)
+
+                if stop_early:
+                    self.logger.info(f"Found {self.early_stop_threshold} consecutive already saved jobs on page {page}. Stopping crawl cycle early.")
+                    break
+                
+                if has_more_pages:
+                    page += 1
+                    self._log_pagination_status(page, pages_to_scan, crawl_all_pages)
+                else:
+                    self.logger.info(f"No more pages available after page {page}. Stopping crawl cycle.")
+                    break
+
+            new_jobs_count += self._save_fetched_details(storage, pending_details, 0)
         
         self.logger.info(f"Completed crawl cycle. Found {new_jobs_count} new jobs.")
         return new_jobs_count
         
+    def _filter_new_listings(self, storage: JobStorage, job_listings: List[Dict[str, Any]],
+                             scheduled_ids: Set[str], consecutive_seen: int) -> Tuple[List[Dict[str, Any]], int, bool]:
+        new_listings = []
+        reached_seen_jobs = False
+
+        for job in job_listings:
+            job_id = job['id']
+
+            if job_id in scheduled_ids or storage.job_exists(job_id):
+                consecutive_seen += 1
+                reached_seen_jobs = reached_seen_jobs or consecutive_seen >= self.early_stop_threshold
+            else:
+                consecutive_seen = 0
+                scheduled_ids.add(job_id)
+                new_listings.append(job)
+
+        return new_listings, consecutive_seen, reached_seen_jobs
+        
+    def _fetch_job_details(self, crawler: CrawlerInterface, job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        if get_exit_flag():
+            return None
+
+        try:
+            return crawler.get_job_details(job)
+        except Exception as e:
+            self.logger.error(f"Unexpected error fetching details for job {job.get('id')}: {str(e)}")
+            return None
+        
+    def _save_fetched_details(self, storage: JobStorage, pending_details: Deque[Future], max_pending: int) -> int:
+        fetched_jobs = []
+
+        while len(pending_details) > max_pending:
+            detailed_job = pending_details.popleft().result()
+            if detailed_job:
+                fetched_jobs.append(detailed_job)
+
+        return storage.save_jobs_batch(fetched_jobs) if fetched_jobs else 0
+        
     def _log_pagination_status(self, page: int, pages_to_scan: float, crawl_all_pages: bool) -> None:
         if crawl_all_pages:
             self.logger.info(f"Moving to page {page} (crawling all available pages)")
@@ -85,41 +165,41 @@ class CrawlerEngine:
     def crawl_continuously(self) -> NoReturn:
         self.logger.info("Starting continuous crawler...")
         
+        storage = JobStorage(self.config)
+        crawler = create_crawler(self.site, self.config)
+        
         try:
             cycle_count = 1
 
             while not get_exit_flag():
                 self.logger.info(f"Starting crawl cycle {cycle_count}")
                 
-                storage = JobStorage(self.config)
                 is_first_run = storage.is_first_run()
                 
-                new_jobs = self.crawl_once(crawl_all_pages=is_first_run)
+                new_jobs = self.crawl_once(crawl_all_pages=is_first_run, storage=storage, crawler=crawler)
                 
                 self.logger.info(f"Crawl cycle {cycle_count} completed. Found {new_jobs} new jobs.")
                 
                 if is_first_run and new_jobs > 0:
                     self.logger.info("Completed initial full crawl. Future cycles will check for newest jobs only.")
                     
-                self._sleep_between_cycles()
+                if self._sleep_between_cycles():
+                    break
+
                 cycle_count += 1
                 
         except Exception as e:
             self.logger.error(f"Error in continuous crawling: {str(e)}")
             raise
         finally:
+            crawler.close()
+            storage.close()
             self.logger.info("Continuous crawler stopped.")
             
-    def _sleep_between_cycles(self) -> None:
+    def _sleep_between_cycles(self) -> bool:
         self.logger.info(f"Sleeping for {self.sleep_interval} seconds until next cycle...")
         
-        sleep_start = time.time()
-        
-        while time.time() - sleep_start < self.sleep_interval:
-            if get_exit_flag():
-                break
-                
-            time.sleep(min(1, self.sleep_interval))
+        return wait_for_exit_signal(self.sleep_interval)
 
 
 def crawl_once(config: Dict[str, Any], crawl_all_pages: bool = False) -> int:
@@ -1,13 +1,60 @@
 import time
+import email.utils
+import socket
 import random
 import logging
 import requests
 import functools
+import threading
 
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Callable, Tuple
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
+_clients: Dict[int, 'RateLimitedClient'] = {}
+_clients_lock = threading.Lock()
+
+DNS_CACHE_MAX_ENTRIES = 64
+
+RESPONSE_CHUNK_SIZE = 64 * 1024
+
+MAX_RATE_DIVISOR = 16
+
+_original_getaddrinfo = socket.getaddrinfo
+_dns_cache: Dict[Tuple, Tuple[float, Any]] = {}
+_dns_cache_ttl = 0.0
+
+
+def _cached_getaddrinfo(*args, **kwargs):
+    key = (args, tuple(sorted(kwargs.items())))
+    now = time.monotonic()
+    cached = _dns_cache.get(key)
+
+    if cached and now - cached[0] < _dns_cache_ttl:
+        return cached[1]
+
+    result = _original_getaddrinfo(*args, **kwargs)
+
+    if len(_dns_cache) >= DNS_CACHE_MAX_ENTRIES:
+        _dns_cache.clear()
+
+    _dns_cache[key] = (now, result)
+    return result
+
+
+def install_dns_cache(ttl: float) -> None:
+    global _dns_cache_ttl
+
+    if ttl <= 0:
+        return
+
+    _dns_cache_ttl = ttl
+
+    if socket.getaddrinfo is not _cached_getaddrinfo:
+        socket.getaddrinfo = _cached_getaddrinfo
+        logger.debug(f"Caching DNS lookups for {ttl} seconds")
+
 
 def retry_with_backoff(max_retries: int = 3, initial_backoff: float = 1.0):
     def decorator(func: Callable):
@@ -34,6 +81,17 @@ def retry_with_backoff(max_retries: int = 3, initial_backoff: float = 1.0):
     return decorator
 
 
+class KeepAliveAdapter(HTTPAdapter):
+    socket_options = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = self.socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
 class RateLimitedClient:
     def __init__(self, config: Dict[str, Any]):
         self.config = config
@@ -41,11 +99,21 @@ class RateLimitedClient:
         self.timeout = self.crawling_config['timeout']
         self.max_retries = self.crawling_config['max_retries']
         self.user_agent = self.crawling_config['user_agent']
+        self.max_response_bytes = self.crawling_config.get('max_response_bytes', 2 * 1024 * 1024)
+
+        install_dns_cache(self.crawling_config.get('dns_cache_ttl', 300))
 
-        self.rate_limited = False
-        self.last_request_time = 0
-        self.min_request_interval = 1.5
+        self.rate_divisor = 1
+        self.slow_until = 0.0
+        self.rate_limit_recovery = self.crawling_config.get('rate_limit_recovery', 300)
+        self.refill_rate = self.crawling_config.get('requests_per_second', 0.66)
+        self.bucket_capacity = self.crawling_config.get('request_burst', 3)
+        self.tokens = float(self.bucket_capacity)
+        self.last_refill = time.monotonic()
+        self.blocked_until = 0.0
         self.rate_limit_backoff = 30
+        self._throttle_lock = threading.Lock()
+        self._content_encoding_logged = False
         
         self.session = self._create_session()
         self._setup_proxy()
@@ -60,6 +128,11 @@ class RateLimitedClient:
             'Referer': 'https://www.topcv.vn/'
         })
 
+        pool_size = self.crawling_config.get('detail_workers', 8)
+        adapter = KeepAliveAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=0, pool_block=False)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+
         return session
 
     def _setup_proxy(self) -> None:
@@ -81,25 +154,56 @@ class RateLimitedClient:
         else:
             logger.warning("Proxy is enabled but no proxy URLs are configured")
     
+    def _reserve_request_slot(self) -> float:
+        now = time.monotonic()
+
+        if self.rate_divisor > 1 and now >= self.slow_until:
+            self.rate_divisor = 1
+            logger.info(f"Restoring request rate to {self.refill_rate} requests per second")
+
+        refill_rate = self.refill_rate / self.rate_divisor
+
+        self.tokens = min(self.bucket_capacity, self.tokens + (now - self.last_refill) * refill_rate)
+        self.last_refill = now
+
+        self.tokens -= 1
+        return max(0.0, self.blocked_until - now, -self.tokens / refill_rate)
+
     def _throttle_request(self) -> None:
-        now = time.time()
-        time_since_last = now - self.last_request_time
-        
-        delay = self.min_request_interval
+        with self._throttle_lock:
+            delay = self._reserve_request_slot()
+            blocked_until = self.blocked_until
 
-        if self.rate_limited:
-            delay = delay * 3
-        
-        delay = delay * (0.8 + 0.4 * random.random())
-        
-        if time_since_last < delay:
-            sleep_time = delay - time_since_last
-            logger.debug(f"Throttling request, sleeping for {sleep_time:.2f} seconds")
-            time.sleep(sleep_time)
+        while delay > 0:
+            # jitter only ever lengthens the wait so a Retry-After is never cut short
+            delay = delay * (1.0 + 0.2 * random.random())
+            logger.debug(f"Throttling request, sleeping for {delay:.2f} seconds")
+            time.sleep(delay)
+
+            with self._throttle_lock:
+                if self.blocked_until == blocked_until:
+                    break
+
+                # a 429 arrived while sleeping, so the slot reserved before it no longer holds
+                delay = self._reserve_request_slot()
+                blocked_until = self.blocked_until
+
+    def _parse_retry_after(self, response: requests.Response) -> float:
+        retry_after = response.headers.get('Retry-After')
+
+        if not retry_after:
+            return self.rate_limit_backoff
+
+        if retry_after.isdigit():
+            return float(retry_after)
+
+        try:
+            retry_at = email.utils.parsedate_to_datetime(retry_after)
+            return max(0.0, retry_at.timestamp() - time.time())
+        except (TypeError, ValueError):
+            return self.rate_limit_backoff
     
-    def _handle_response(self, response: requests.Response, url: str) -> Optional[str]:
-        self.last_request_time = time.time()
-        
+    def _handle_response(self, response: requests.Response, url: str) -> Optional[bytes]:
         if response.status_code == 403:
             logger.error(f"Received 403 Forbidden error from {url}. This may indicate IP blocking.")
             
@@ -109,24 +213,75 @@ class RateLimitedClient:
             raise requests.RequestException("403 Forbidden")
         
         if response.status_code == 429:
-            self.rate_limited = True
+            retry_after = self._parse_retry_after(response)
+
+            with self._throttle_lock:
+                now = time.monotonic()
+                self.rate_divisor = min(self.rate_divisor * 2, MAX_RATE_DIVISOR)
+                self.slow_until = now + self.rate_limit_recovery
+                self.blocked_until = max(self.blocked_until, now + retry_after)
+                self.tokens = 0.0
+                self.last_refill = self.blocked_until
+
+            logger.warning(f"Rate limited by {url}, pausing requests for {retry_after:.0f} seconds "
+                           f"and slowing to {self.refill_rate / self.rate_divisor:.2f} requests per second")
             raise requests.RequestException("429 Too Many Requests")
         
-        self.rate_limited = False
-        response.raise_for_status()
+        if response.status_code >= 500:
+            raise requests.RequestException(f"{response.status_code} Server Error")
+
+        if response.status_code >= 400:
+            logger.warning(f"Received {response.status_code} from {url}, not retrying")
+            return None
+
+        if not self._content_encoding_logged:
+            self._content_encoding_logged = True
+            logger.debug(f"Response Content-Encoding from {url}: {response.headers.get('Content-Encoding', 'identity')}")
         
         if 'text/html' not in response.headers.get('Content-Type', ''):
-            logger.warning(f"Non-HTML response from {url}: {response.headers.get('Content-Type')}")
+            logger.warning(f"Skipping non-HTML response from {url}: {response.headers.get('Content-Type')}")
+            return None
             
-        return response.text
+        return self._read_body(response, url)
+
+    def _read_body(self, response: requests.Response, url: str) -> Optional[bytes]:
+        content_length = response.headers.get('Content-Length', '')
+
+        if content_length.isdigit() and int(content_length) > self.max_response_bytes:
+            logger.warning(f"Skipping response from {url}: Content-Length {content_length} exceeds {self.max_response_bytes} bytes")
+            return None
+
+        chunks = []
+        size = 0
+
+        for chunk in response.iter_content(RESPONSE_CHUNK_SIZE):
+            chunks.append(chunk)
+            size += len(chunk)
+
+            if size > self.max_response_bytes:
+                logger.warning(f"Skipping response from {url}: body exceeds {self.max_response_bytes} bytes")
+                return None
+
+        return b''.join(chunks)
 
     @retry_with_backoff()
-    def make_request(self, url: str) -> Optional[str]:
+    def make_request(self, url: str) -> Optional[bytes]:
         self._throttle_request()
         
         try:
-            response = self.session.get(url, timeout=self.timeout)
-            return self._handle_response(response, url)
+            with self.session.get(url, timeout=self.timeout, stream=True) as response:
+                return self._handle_response(response, url)
         except requests.RequestException as e:
             logger.warning(f"Request failed: {str(e)}")
-            raise 
\ No newline at end of file
+            raise 
+
+
+def get_client(config: Dict[str, Any]) -> RateLimitedClient:
+    with _clients_lock:
+        client = _clients.get(id(config))
+
+        if client is None:
+            client = RateLimitedClient(config)
+            _clients[id(config)] = client
+
+        return client
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Union
 
 
 class CrawlerInterface(ABC):
@@ -11,20 +11,27 @@ class CrawlerInterface(ABC):
     def get_job_details(self, job_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         pass
 
+    def close(self) -> None:
+        pass
+
 
 class ParserInterface(ABC):
     @abstractmethod
-    def extract_job_listings(self, html_content: str) -> List[Dict[str, Any]]:
+    def extract_job_listings(self, html_content: Union[str, bytes]) -> List[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def extract_job_listings_and_more(self, html_content: Union[str, bytes], page: int) -> Tuple[List[Dict[str, Any]], bool]:
         pass
     
     @abstractmethod
-    def extract_job_details(self, html_content: str, job_data: Dict[str, Any]) -> Dict[str, Any]:
+    def extract_job_details(self, html_content: Union[str, bytes], job_data: Dict[str, Any]) -> Dict[str, Any]:
         pass
 
 
 class PaginationInterface(ABC):
     @abstractmethod
-    def has_more_pages(self, html_content: str, current_page: int) -> bool:
+    def has_more_pages(self, html_content: Union[str, bytes], current_page: int, tree: Optional[Any] = None) -> bool:
         pass
 
 
@@ -1,11 +1,11 @@
 import logging
+import multiprocessing
 
-from typing import Dict, List, Optional, Any, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple, Callable
 
-from src.parser import create_parser
 from src.core.interfaces import CrawlerInterface
-from src.core.http_client import RateLimitedClient
-from src.core.pagination import create_pagination_parser
+from src.core.http_client import get_client
 
 logger = logging.getLogger(__name__)
 
@@ -13,16 +13,33 @@ logger = logging.getLogger(__name__)
 class JobCrawlerBase(CrawlerInterface):
     def __init__(self, config: Dict[str, Any]):
         self.config = config
-        self.client = RateLimitedClient(config)
+        self.client = get_client(config)
 
 
 class TopCVCrawler(JobCrawlerBase):
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
+
+        # imported here because src.parser imports src.core, which imports this module
+        from src.parser import create_parser
         self.parser = create_parser('topcv')
         self.crawling_config = config['crawling']
         self.base_url = self.crawling_config['base_url']
-        self.pagination_parser = create_pagination_parser('topcv')
+
+        parse_workers = self.crawling_config.get('parse_workers', 0)
+        self._parse_pool = ProcessPoolExecutor(max_workers=parse_workers,
+                                                mp_context=multiprocessing.get_context('spawn')) if parse_workers > 0 else None
+
+    def close(self) -> None:
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(wait=True)
+            self._parse_pool = None
+
+    def _parse(self, parse_func: Callable, *args: Any) -> Any:
+        if self._parse_pool is None:
+            return parse_func(*args)
+
+        return self._parse_pool.submit(parse_func, *args).result()
         
     def get_job_listings(self, page: int = 1) -> Tuple[List[Dict[str, Any]], bool]:
         url = f"{self.base_url}?page={page}"
@@ -33,11 +50,9 @@ class TopCVCrawler(JobCrawlerBase):
             if not html_content:
                 return [], False
                 
-            job_listings = self.parser.extract_job_listings(html_content)
+            job_listings, has_more_pages = self._parse(self.parser.extract_job_listings_and_more, html_content, page)
             logger.info(f"Found {len(job_listings)} jobs on page {page}")
             
-            has_more_pages = self.pagination_parser.has_more_pages(html_content, page)
-            
             return job_listings, has_more_pages
         except Exception as e:
             logger.error(f"Error getting job listings from page {page}: {str(e)}")
@@ -45,7 +60,11 @@ class TopCVCrawler(JobCrawlerBase):
             
     def get_job_details(self, job_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         job_id = job_data['id']
-        job_url = job_data['url']
+        job_url = job_data.get('url')
+
+        if not job_url:
+            logger.error(f"No detail URL for job {job_id}, skipping")
+            return None
 
         logger.info(f"Fetching job details for job {job_id}: {job_url}")
         
@@ -55,7 +74,7 @@ class TopCVCrawler(JobCrawlerBase):
                 logger.error(f"Failed to get HTML content for job {job_id}")
                 return None
                 
-            detailed_job = self.parser.extract_job_details(html_content, job_data)
+            detailed_job = self._parse(self.parser.extract_job_details, html_content, job_data)
             logger.info(f"Successfully fetched details for job {job_id}")
             
             return detailed_job
@@ -64,12 +83,13 @@ class TopCVCrawler(JobCrawlerBase):
             return None
 
 
+_CRAWLERS = {
+    'topcv': TopCVCrawler,
+}
+
+
 def create_crawler(site_name: str, config: Dict[str, Any]) -> CrawlerInterface:
-    crawlers = {
-        'topcv': TopCVCrawler,
-    }
-    
-    if site_name.lower() in crawlers:
-        return crawlers[site_name.lower()](config)
+    if site_name.lower() in _CRAWLERS:
+        return _CRAWLERS[site_name.lower()](config)
     else:
-        raise ValueError(f"Unsupported site: {site_name}") 
\ No newline at end of file
+        raise ValueError(f"Unsupported site: {site_name}")
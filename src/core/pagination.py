@@ -1,40 +1,61 @@
 import re
 import logging
+import functools
+import lxml.html
 
-from bs4 import BeautifulSoup
+from lxml import etree
+from typing import Optional, Union
 from src.core.interfaces import PaginationInterface
 
 logger = logging.getLogger(__name__)
 
+_NEXT_MARKERS = ('›', 'rel="next"')
+_NEXT_MARKERS_BYTES = tuple(marker.encode('utf-8') for marker in _NEXT_MARKERS)
+
+_PAGE_RE = re.compile(r'page=(\d+)')
+_PROGRESS_RE = re.compile(r'(\d+)\s*/\s*(\d+)')
+
+_NEXT_LINK_XPATH = etree.XPath(
+    'boolean(//a[@rel="next"]) or '
+    '(boolean(//*[contains(concat(" ", normalize-space(@class), " "), " box-pagination ")]) '
+    'and boolean(//a[contains(., "›")]))'
+)
+_PAGE_LINKS_XPATH = etree.XPath('//a[contains(@data-href, "page=")]/@data-href')
+_JOB_ITEMS_COUNT_XPATH = etree.XPath(
+    'count(//*[contains(concat(" ", normalize-space(@class), " "), " job-item-search-result ")])'
+)
+
 
 class PaginationParser(PaginationInterface):
     @staticmethod
-    def has_more_pages(html_content: str, current_page: int) -> bool:
+    def has_more_pages(html_content: Union[str, bytes], current_page: int,
+                       tree: Optional[lxml.html.HtmlElement] = None) -> bool:
         try:
-            soup = BeautifulSoup(html_content, 'lxml')
+            markers = _NEXT_MARKERS_BYTES if isinstance(html_content, bytes) else _NEXT_MARKERS
+
+            if any(marker in html_content for marker in markers):
+                logger.debug("Found next page marker in page source")
+                return True
+
+            if tree is None:
+                tree = lxml.html.fromstring(html_content)
             
-            if soup.select_one('a[rel="next"]'):
-                logger.debug("Found next page link with rel='next' attribute")
+            if _NEXT_LINK_XPATH(tree):
+                logger.debug("Found next page link")
                 return True
             
-            for link in soup.select('a[data-href*="page="]'):
-                href = link.get('data-href', '')
-
-                if 'page=' in href:
-                    try:
-                        page_param = re.search(r'page=(\d+)', href)
-
-                        if page_param and int(page_param.group(1)) > current_page:
-                            logger.debug(f"Found link with page parameter: {page_param.group(1)}")
-                            return True
-                    except:
-                        pass
+            for href in _PAGE_LINKS_XPATH(tree):
+                page_param = _PAGE_RE.search(href)
+
+                if page_param and int(page_param.group(1)) > current_page:
+                    logger.debug(f"Found link with page parameter: {page_param.group(1)}")
+                    return True
             
-            paginate_text = soup.select_one('#job-listing-paginate-text')
+            paginate_text = tree.get_element_by_id('job-listing-paginate-text', None)
 
-            if paginate_text:
-                text = paginate_text.get_text(strip=True)
-                match = re.search(r'(\d+)\s*/\s*(\d+)', text)
+            if paginate_text is not None:
+                text = paginate_text.text_content().strip()
+                match = _PROGRESS_RE.search(text)
 
                 if match:
                     current = int(match.group(1))
@@ -44,26 +65,10 @@ class PaginationParser(PaginationInterface):
                         logger.debug(f"Found pagination text: page {current} of {total}")
                         return True
             
-            if soup.select_one('.box-pagination'):
-                pagination_selectors = [
-                    '.pagination a',
-                    'ul.pagination li a',
-                    'a[aria-label*="Next"]',
-                    'a:-soup-contains("›")'
-                ]
-                
-                for selector in pagination_selectors:
-                    links = soup.select(selector)
-
-                    for link in links:
-                        if link.get('rel') == ['next'] or '›' in link.get_text():
-                            logger.debug("Found next page indicator in pagination")
-                            return True
-            
-            job_items = soup.select('.job-item-search-result')
+            job_items_count = int(_JOB_ITEMS_COUNT_XPATH(tree))
 
-            if len(job_items) >= 20:
-                logger.debug(f"Found {len(job_items)} job items, assuming more pages exist")
+            if job_items_count >= 20:
+                logger.debug(f"Found {job_items_count} job items, assuming more pages exist")
                 return True
             
             logger.info("No more pages detected")
@@ -73,12 +78,14 @@ class PaginationParser(PaginationInterface):
             return False
 
 
+_PAGINATION_PARSERS = {
+    'topcv': PaginationParser,
+}
+
+
+@functools.lru_cache(maxsize=4)
 def create_pagination_parser(site_name: str) -> PaginationInterface:
-    parsers = {
-        'topcv': PaginationParser(),
-    }
-    
-    if site_name.lower() in parsers:
-        return parsers[site_name.lower()]
+    if site_name.lower() in _PAGINATION_PARSERS:
+        return _PAGINATION_PARSERS[site_name.lower()]()
     else:
-        raise ValueError(f"Unsupported site for pagination parsing: {site_name}") 
\ No newline at end of file
+        raise ValueError(f"Unsupported site for pagination parsing: {site_name}")
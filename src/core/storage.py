@@ -1,20 +1,60 @@
 import os
+import csv
 import json
+import time
+import queue
 import pickle
 import logging
-import pandas as pd
+import threading
 
-from typing import Dict, List, Set, Any
+from typing import Dict, List, Set, Any, Union
 from src.core.interfaces import StorageInterface
+from src.utils.filesystem import jobs_jsonl_path
 
 logger = logging.getLogger(__name__)
 
+LEGACY_JOB_CACHE_FILE = 'job_cache.pkl'
+
+WRITE_BATCH_SIZE = 64
+WRITE_FLUSH_INTERVAL = 1.0
+
+_STOP_WRITER = object()
+
+
+def _encode_csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False)
+
+    return value
+
+
+def _job_id_key(job_id: str) -> Union[int, str]:
+    if job_id.isascii() and job_id.isdigit() and not job_id.startswith('0'):
+        return int(job_id)
+
+    return job_id
+
+
+def migrate_json_to_jsonl(json_path: str, jsonl_path: str) -> int:
+    with open(json_path, 'r', encoding='utf-8') as f:
+        jobs = json.load(f)
+
+    with open(jsonl_path, 'w', encoding='utf-8') as f:
+        for job in jobs:
+            f.write(json.dumps(job, ensure_ascii=False) + '\n')
+
+    logger.info(f"Migrated {len(jobs)} jobs from {json_path} to {jsonl_path}")
+    return len(jobs)
+
 
 class JobStorage(StorageInterface):
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.jobs_csv_path = config['output']['jobs_csv'] 
-        self.jobs_json_path = config['output']['jobs_json']
+        self.jobs_jsonl_path = jobs_jsonl_path(config)
         self.job_cache_file = config['output']['job_cache_file']
         
         self.expected_fields = [
@@ -25,54 +65,86 @@ class JobStorage(StorageInterface):
         ]
         
         self._create_output_directories()
+        self._migrate_legacy_json()
         self.job_ids = self._load_job_id_cache()
+        self._open_output_files()
+
+        self._write_queue = queue.Queue(maxsize=1000)
+        self._writer_thread = threading.Thread(target=self._writer_loop, name='job-storage-writer', daemon=True)
+        self._writer_thread.start()
         
     def _create_output_directories(self) -> None:
-        os.makedirs(os.path.dirname(self.jobs_json_path), exist_ok=True)
+        os.makedirs(os.path.dirname(self.jobs_jsonl_path), exist_ok=True)
         os.makedirs(os.path.dirname(self.jobs_csv_path), exist_ok=True)
         os.makedirs(os.path.dirname(self.job_cache_file), exist_ok=True)
         
+    def _open_output_files(self) -> None:
+        csv_exists = os.path.exists(self.jobs_csv_path) and os.path.getsize(self.jobs_csv_path) > 0
+
+        self._jsonl_file = open(self.jobs_jsonl_path, 'a', encoding='utf-8')
+        self._ids_file = open(self.job_cache_file, 'a', encoding='utf-8')
+        self._csv_file = open(self.jobs_csv_path, 'a', encoding='utf-8', newline='')
+        self._csv_writer = csv.DictWriter(
+            self._csv_file,
+            fieldnames=self.expected_fields,
+            extrasaction='ignore',
+            lineterminator='\n'
+        )
+
+        if not csv_exists:
+            self._csv_writer.writeheader()
+            self._csv_file.flush()
+
+    def close(self) -> None:
+        if self._writer_thread.is_alive():
+            self._write_queue.put(_STOP_WRITER)
+            self._writer_thread.join()
+
+        for f in (self._jsonl_file, self._csv_file, self._ids_file):
+            if not f.closed:
+                f.close()
+        
     def is_first_run(self) -> bool:
         return len(self.job_ids) == 0
         
     def job_exists(self, job_id: str) -> bool:
-        return job_id in self.job_ids
+        return _job_id_key(job_id) in self.job_ids
         
     def save_job(self, job: Dict[str, Any]) -> bool:
-        try:
-            job_id = job['id']
-            if self.job_exists(job_id):
-                logger.debug(f"Job {job_id} already exists in cache, skipping")
-                return False
-                
-            self._append_to_json(job)
-            self._append_to_csv(job)
-            
-            self.job_ids.add(job_id)
-            self._save_job_id_cache()
-            
-            logger.info(f"Job {job_id} saved successfully")
-            return True
-        except Exception as e:
-            logger.error(f"Error saving job: {str(e)}")
-            return False
+        return self.save_jobs_batch([job]) == 1
             
     def save_jobs_batch(self, jobs: List[Dict[str, Any]]) -> int:
-        new_jobs_count = 0
+        new_jobs = []
+
         for job in jobs:
-            if self.save_job(job):
-                new_jobs_count += 1
+            try:
+                job_id = job['id']
+                if self.job_exists(job_id):
+                    logger.debug(f"Job {job_id} already exists in cache, skipping")
+                    continue
+                    
+                self.job_ids.add(_job_id_key(job_id))
+                new_jobs.append(job)
+                
+                logger.info(f"Job {job_id} queued for saving")
+            except Exception as e:
+                logger.error(f"Error saving job: {str(e)}")
+
+        if new_jobs:
+            self._write_queue.put(new_jobs)
                 
-        return new_jobs_count
+        return len(new_jobs)
             
     def get_job_count(self) -> int:
         return len(self.job_ids)
         
-    def _load_job_id_cache(self) -> Set[str]:
+    def _load_job_id_cache(self) -> Set[Union[int, str]]:
         try:
+            self._migrate_pickle_cache()
+
             if os.path.exists(self.job_cache_file):
                 with open(self.job_cache_file, 'rb') as f:
-                    job_ids = pickle.load(f)
+                    job_ids = {_job_id_key(line.decode('utf-8')) for line in f.read().split(b'\n') if line}
                 logger.info(f"Loaded {len(job_ids)} job IDs from cache")
                 return job_ids
             else:
@@ -81,72 +153,98 @@ class JobStorage(StorageInterface):
         except Exception as e:
             logger.error(f"Error loading job ID cache: {str(e)}")
             return set()
+
+    def _migrate_pickle_cache(self) -> None:
+        legacy_file = os.path.join(os.path.dirname(self.job_cache_file), LEGACY_JOB_CACHE_FILE)
+
+        if os.path.exists(self.job_cache_file):
+            with open(self.job_cache_file, 'rb') as f:
+                if f.read(1) != pickle.PROTO:
+                    return
+            legacy_file = self.job_cache_file
+        elif not os.path.exists(legacy_file):
+            return
+
+        with open(legacy_file, 'rb') as f:
+            job_ids = pickle.load(f)
+
+        with open(self.job_cache_file, 'w', encoding='utf-8') as f:
+            f.writelines(f"{job_id}\n" for job_id in job_ids)
+
+        logger.info(f"Migrated {len(job_ids)} job IDs from {legacy_file} to {self.job_cache_file}")
+            
+    def _writer_loop(self) -> None:
+        stopping = False
+
+        while not stopping:
+            jobs = self._write_queue.get()
+
+            if jobs is _STOP_WRITER:
+                break
+
+            batch = list(jobs)
+            deadline = time.monotonic() + WRITE_FLUSH_INTERVAL
+
+            while len(batch) < WRITE_BATCH_SIZE:
+                try:
+                    jobs = self._write_queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+
+                if jobs is _STOP_WRITER:
+                    stopping = True
+                    break
+
+                batch.extend(jobs)
+
+            self._write_batch(batch)
+
+    def _write_batch(self, jobs: List[Dict[str, Any]]) -> None:
+        for job in jobs:
+            self._append_to_json(job)
+            self._append_to_csv(job)
+            self._append_job_id(job['id'])
+
+        try:
+            for f in (self._jsonl_file, self._csv_file, self._ids_file):
+                f.flush()
+                os.fsync(f.fileno())
+
+            logger.debug(f"Wrote {len(jobs)} jobs to disk")
+        except Exception as e:
+            logger.error(f"Error flushing job files: {str(e)}")
             
-    def _save_job_id_cache(self) -> None:
+    def _append_job_id(self, job_id: str) -> None:
         try:
-            with open(self.job_cache_file, 'wb') as f:
-                pickle.dump(self.job_ids, f)
-            logger.debug(f"Saved {len(self.job_ids)} job IDs to cache")
+            self._ids_file.write(f"{job_id}\n")
         except Exception as e:
             logger.error(f"Error saving job ID cache: {str(e)}")
             
-    def _load_existing_jobs_json(self) -> List[Dict[str, Any]]:
-        if not os.path.exists(self.jobs_json_path) or os.path.getsize(self.jobs_json_path) == 0:
-            return []
-            
+    def _migrate_legacy_json(self) -> None:
+        legacy_path = os.path.splitext(self.jobs_jsonl_path)[0] + '.json'
+
+        if os.path.exists(self.jobs_jsonl_path) or not os.path.exists(legacy_path) or os.path.getsize(legacy_path) == 0:
+            return
+
         try:
-            with open(self.jobs_json_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except json.JSONDecodeError:
-            logger.warning(f"Error decoding JSON from {self.jobs_json_path}, initializing empty list")
-            return []
+            migrate_json_to_jsonl(legacy_path, self.jobs_jsonl_path)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Could not migrate {legacy_path} to JSON Lines: {str(e)}")
         
     def _append_to_json(self, job: Dict[str, Any]) -> None:
         try:
-            jobs = self._load_existing_jobs_json()
-            jobs.append(job)
-            
-            with open(self.jobs_json_path, 'w', encoding='utf-8') as f:
-                json.dump(jobs, f, ensure_ascii=False, indent=2)
+            self._jsonl_file.write(json.dumps(job, ensure_ascii=False) + '\n')
                 
         except Exception as e:
-            logger.error(f"Error appending to JSON: {str(e)}")
+            logger.error(f"Error appending to JSON Lines: {str(e)}")
     
     def _normalize_job_for_csv(self, job: Dict[str, Any]) -> Dict[str, Any]:
-        normalized_job = {}
-        
-        for field in self.expected_fields:
-            value = job.get(field, "")
-            
-            if value is None:
-                normalized_job[field] = ""
-            elif isinstance(value, (list, dict)):
-                normalized_job[field] = json.dumps(value, ensure_ascii=False)
-            else:
-                normalized_job[field] = value
-                
-        return normalized_job
+        get = job.get
+        return {field: _encode_csv_value(get(field, "")) for field in self.expected_fields}
             
     def _append_to_csv(self, job: Dict[str, Any]) -> None:
         try:
-            normalized_job = self._normalize_job_for_csv(job)
-            df_new = pd.DataFrame([normalized_job])
-            
-            for col in self.expected_fields:
-                if col not in df_new.columns:
-                    df_new[col] = ""
-            
-            df_new = df_new[self.expected_fields]
-            
-            file_exists = os.path.exists(self.jobs_csv_path) and os.path.getsize(self.jobs_csv_path) > 0
-
-            df_new.to_csv(
-                self.jobs_csv_path, 
-                mode='a' if file_exists else 'w',
-                header=not file_exists, 
-                index=False, 
-                encoding='utf-8'
-            )
+            self._csv_writer.writerow(self._normalize_job_for_csv(job))
                 
         except Exception as e:
-            logger.error(f"Error appending to CSV: {str(e)}") 
\ No newline at end of file
+            logger.error(f"Error appending to CSV: {str(e)}")
\ No newline at end of file
@@ -1,42 +1,52 @@
 import logging
+import functools
 
-from bs4 import BeautifulSoup
-from typing import Dict, Any
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple, Union
 
 from src.parser.templates import (
-    detect_template_type,
+    detect_template,
     parse_premium_template,
     parse_standard_template, 
     parse_brand_template,
     parse_fallback_template
 )
-from src.parser.html_tools import clean_list_formatting, clean_location_text
+from src.parser.html_tools import clean_list_formatting, clean_location_text, parse_html
 
 logger = logging.getLogger(__name__)
 
+BATCH_CHUNK_SIZE = 16
+
+_TEMPLATE_PARSERS = {
+    "premium": parse_premium_template,
+    "standard": parse_standard_template,
+    "brand": parse_brand_template,
+}
+
+
+def extract_job_details(html_content: Union[str, bytes], job_data: Dict[str, Any],
+                        crawled_at: Optional[str] = None, copy: bool = False) -> Dict[str, Any]:
+    if crawled_at is None:
+        crawled_at = datetime.now().isoformat()
 
-def extract_job_details(html_content: str, job_data: Dict[str, Any]) -> Dict[str, Any]:
     try:
-        soup = BeautifulSoup(html_content, 'lxml')
+        tree = parse_html(html_content)
         
-        details = job_data.copy()
+        details = job_data.copy() if copy else job_data
         
         details['salary_min'] = None
         details['salary_max'] = None
         details['salary_currency'] = None
         details['salary_negotiable'] = False
         
-        template_type = detect_template_type(soup)
+        template_type, sections = detect_template(tree)
         logger.info(f"Detected template type: {template_type}")
         
-        if template_type == "premium":
-            details = parse_premium_template(soup, details)
-        elif template_type == "standard":
-            details = parse_standard_template(soup, details)
-        elif template_type == "brand":
-            details = parse_brand_template(soup, details)
-        else:
-            details = parse_fallback_template(soup, details)
+        parse_template = _TEMPLATE_PARSERS.get(template_type, parse_fallback_template)
+        details = parse_template(tree, details, sections)
+
+        details['crawled_at'] = crawled_at
         
         if 'salary_details' in details and not details['salary_details']:
             del details['salary_details']
@@ -51,4 +61,20 @@ def extract_job_details(html_content: str, job_data: Dict[str, Any]) -> Dict[str
         return details
     except Exception as e:
         logger.error(f"Error extracting job details: {str(e)}")
-        return job_data 
\ No newline at end of file
+        return job_data
+
+
+def _extract_one(pair: Tuple[Union[str, bytes], Dict[str, Any]], crawled_at: str) -> Dict[str, Any]:
+    html_content, job_data = pair
+    return extract_job_details(html_content, job_data, crawled_at)
+
+
+def extract_job_details_batch(pairs: List[Tuple[Union[str, bytes], Dict[str, Any]]],
+                              workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    if not pairs:
+        return []
+
+    extract_one = functools.partial(_extract_one, crawled_at=datetime.now().isoformat())
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(extract_one, pairs, chunksize=BATCH_CHUNK_SIZE)) 
\ No newline at end of file
@@ -1,20 +1,99 @@
 import re
 import logging
 import hashlib
+import threading
+import lxml.html
 
-from bs4 import Tag
-from typing import Optional
+from lxml import etree
+from typing import AbstractSet, List, Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+try:
+    import re2 as list_regex  # linear-time matching on long description text
+except ImportError:
+    list_regex = re
+
+_TEXT_NODES_XPATH = etree.XPath(
+    './/text()[not(parent::script) and not(parent::style)]',
+    smart_strings=False
+)
+
+HTML_ENCODING = 'utf-8'
+
+_parsers = threading.local()
+
+_JOB_ID_HTML_RE = re.compile(r'/(\d+)\.html')
+_JOB_ID_J_RE = re.compile(r'j(\d+)')
+
+# Python's Unicode \s spelled out, since re2 only treats ASCII characters as \s
+_SPACE = '[\t\n\x0b\x0c\r\x1c-\x1f \x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]'
+
+_BULLET_RE = list_regex.compile(r'(?m)(?:^|\n)' + _SPACE + r'*[•\-*+✓✔→⇒»◆◇◈○●◎◉▪▫□■★☆]+' + _SPACE + '*')
+_NUMBERING_RE = list_regex.compile(r'(?m)(?:^|\n)' + _SPACE + r'*(?:\d+\.|\d+\)|\(\d+\)|[ivxIVX]+\.|\([ivxIVX]+\))' + _SPACE + '*')
+_BLANK_LINES_OR_CIRCLE_RE = list_regex.compile(r'(?P<blank_lines>\n{3,})|●' + _SPACE + '*')
+
+_LOCATION_START_RE = re.compile(r'^\s*-\s*([^:]+):\s*')
+_LOCATION_LINE_RE = re.compile(r'\n\s*-\s*([^:]+):\s*')
+
+
+def _html_parser() -> lxml.html.HTMLParser:
+    parser = getattr(_parsers, 'html', None)
+
+    if parser is None:
+        parser = _parsers.html = lxml.html.HTMLParser(encoding=HTML_ENCODING)
+
+    return parser
+
+
+def parse_html(html_content: Union[str, bytes, lxml.html.HtmlElement]) -> lxml.html.HtmlElement:
+    if isinstance(html_content, lxml.html.HtmlElement):
+        return html_content
+
+    if isinstance(html_content, bytes):
+        return lxml.html.fromstring(html_content, parser=_html_parser())
+
+    return lxml.html.fromstring(html_content)
+
+
+def select_one(element: lxml.html.HtmlElement, selector: etree.XPath) -> Optional[lxml.html.HtmlElement]:
+    matches = selector(element)
+    return matches[0] if matches else None
+
+
+def find_heading_and_content(element: lxml.html.HtmlElement, content_classes: AbstractSet[str],
+                             heading_tags: AbstractSet[str] = frozenset(), heading_classes: AbstractSet[str] = frozenset()
+                             ) -> Tuple[Optional[lxml.html.HtmlElement], Optional[lxml.html.HtmlElement]]:
+    heading = None
+    content = None
+
+    for node in element.iterdescendants(etree.Element):
+        class_attr = node.get('class')
+        classes = class_attr.split() if class_attr else ()
+
+        if heading is None and (node.tag in heading_tags or not heading_classes.isdisjoint(classes)):
+            heading = node
+
+        if content is None and not content_classes.isdisjoint(classes):
+            content = node
+
+        if heading is not None and content is not None:
+            break
+
+    return heading, content
+
+
+def element_text(element: lxml.html.HtmlElement) -> str:
+    return ''.join(text.strip() for text in _TEXT_NODES_XPATH(element))
+
 
 def extract_job_id(url: str) -> str:
-    match = re.search(r'/(\d+)\.html', url)
+    match = _JOB_ID_HTML_RE.search(url)
 
     if match:
         return match.group(1)
 
-    match = re.search(r'j(\d+)', url)
+    match = _JOB_ID_J_RE.search(url)
 
     if match:
         return match.group(1)
@@ -22,25 +101,17 @@ def extract_job_id(url: str) -> str:
     return hashlib.md5(url.encode()).hexdigest()
 
 
+def _replace_blank_lines_or_circle(match: re.Match) -> str:
+    return '\n\n' if match.group('blank_lines') else '- '
+
+
 def clean_list_formatting(text: str) -> str:
     if not text:
         return text
 
-    bullet_patterns = [
-        r'(?m)^[\s]*[•\-\*\+\✓\✔\→\⇒\»\◆\◇\◈\○\●\◎\◉\▪\▫\□\■\★\☆]+\s*',
-        r'(?m)^[\s]*(?:\d+\.|\d+\)|\(\d+\)|[ivxIVX]+\.|\([ivxIVX]+\))\s*',
-        r'\n[\s]*[•\-\*\+\✓\✔\→\⇒\»\◆\◇\◈\○\●\◎\◉\▪\▫\□\■\★\☆]+\s*',
-        r'\n[\s]*(?:\d+\.|\d+\)|\(\d+\)|[ivxIVX]+\.|\([ivxIVX]+\))\s*',
-    ]
-    
-    cleaned_text = text
-    
-    for pattern in bullet_patterns:
-        cleaned_text = re.sub(pattern, '- ', cleaned_text)
-    
-    cleaned_text = re.sub(r'\n{3,}', '\n\n', cleaned_text)
-    
-    cleaned_text = re.sub(r'●\s*', '- ', cleaned_text)
+    cleaned_text = _BULLET_RE.sub('- ', text)
+    cleaned_text = _NUMBERING_RE.sub('- ', cleaned_text)
+    cleaned_text = _BLANK_LINES_OR_CIRCLE_RE.sub(_replace_blank_lines_or_circle, cleaned_text)
 
     return cleaned_text.strip()
 
@@ -49,41 +120,39 @@ def clean_location_text(location_text: str) -> str:
     if not location_text:
         return ""
         
-    cleaned_text = re.sub(r'^\s*-\s*([^:]+):\s*', r'\1 ', location_text)
-    cleaned_text = re.sub(r'\n\s*-\s*([^:]+):\s*', r'\n\1 ', cleaned_text)
+    cleaned_text = _LOCATION_START_RE.sub(r'\1 ', location_text)
+    cleaned_text = _LOCATION_LINE_RE.sub(r'\n\1 ', cleaned_text)
 
     return cleaned_text.strip()
 
 
-def parse_html_content(content: Tag) -> str:
-    if not content:
-        return ""
+def list_item_texts(content: lxml.html.HtmlElement) -> List[str]:
+    return [element_text(item) for item in content.iterdescendants('li')]
 
-    result = []
-    list_items = content.select('li')
 
-    if list_items:
-        for item in list_items:
-            item_text = item.get_text(strip=True)
+def parse_html_content(content: Optional[lxml.html.HtmlElement], item_texts: Optional[List[str]] = None) -> str:
+    if content is None:
+        return ""
+
+    if item_texts is None:
+        item_texts = list_item_texts(content)
 
-            if item_text:
-                result.append(f"- {item_text}")
-    else:
-        result.append(content.get_text(strip=True))
+    if item_texts:
+        return "\n".join(f"- {item_text}" for item_text in item_texts if item_text)
 
-    return "\n".join(result)
+    return element_text(content)
 
 
-def find_content_after_heading(heading_tag: Tag) -> Optional[Tag]:
-    for sibling in heading_tag.next_siblings:
-        if sibling.name and sibling.get_text(strip=True):
+def find_content_after_heading(heading_tag: lxml.html.HtmlElement) -> Optional[lxml.html.HtmlElement]:
+    for sibling in heading_tag.itersiblings():
+        if isinstance(sibling.tag, str) and element_text(sibling):
             return sibling
 
-    parent = heading_tag.parent
+    parent = heading_tag.getparent()
 
-    if parent:
-        for sibling in parent.next_siblings:
-            if sibling.name and sibling.get_text(strip=True):
+    if parent is not None:
+        for sibling in parent.itersiblings():
+            if isinstance(sibling.tag, str) and element_text(sibling):
                 return sibling
 
     return None
\ No newline at end of file
@@ -1,87 +1,100 @@
 import re
 import logging
+import lxml.html
 
-from bs4 import BeautifulSoup
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Union
+from lxml.cssselect import CSSSelector
 
-from src.parser.html_tools import extract_job_id
+from src.parser.html_tools import extract_job_id, parse_html, select_one, element_text
 
 logger = logging.getLogger(__name__)
 
+_JOB_ITEMS = CSSSelector('.job-item-search-result')
+_TITLE_LINK = CSSSelector('.title a')
+_COMPANY_NAME = CSSSelector('.company-name')
+_ADDRESS = CSSSelector('.address')
+_SALARY = CSSSelector('.title-salary')
+_LABEL_UPDATE = CSSSelector('.label-update')
+_EXPERIENCE = CSSSelector('.exp')
 
-def extract_job_listings(html_content: str) -> List[Dict[str, Any]]:
+_POSTED_PREFIX = re.compile(r'^Đăng')
+_SALARY_NOISE_RE = re.compile(r'^[^a-zA-Z0-9]+|\s+$|(?P<space>\s+)')
+
+
+def _replace_salary_noise(match: re.Match) -> str:
+    return ' ' if match.group('space') else ''
+
+
+def _parse_one_item(job_item: lxml.html.HtmlElement, crawled_at: str) -> Optional[Dict[str, Any]]:
+    title_link = select_one(job_item, _TITLE_LINK)
+
+    if title_link is None:
+        return None
+        
+    job_title = element_text(title_link)
+    job_url = title_link.get('href', '')
+    
+    job_id = extract_job_id(job_url)
+    
+    company_element = select_one(job_item, _COMPANY_NAME)
+    company_name = element_text(company_element) if company_element is not None else ''
+    
+    location_element = select_one(job_item, _ADDRESS)
+    location = element_text(location_element) if location_element is not None else ''
+    
+    salary_element = select_one(job_item, _SALARY)
+    salary = element_text(salary_element) if salary_element is not None else 'Thỏa thuận'
+
+    salary = _SALARY_NOISE_RE.sub(_replace_salary_noise, salary)
+    
+    date_element = select_one(job_item, _LABEL_UPDATE)
+    posted_date = ""
+    last_updated = ""
+    
+    if date_element is not None:
+        posted_date = element_text(date_element)
+        posted_date = _POSTED_PREFIX.sub('', posted_date).strip()
+        
+        if date_element.get('data-original-title') is not None:
+            last_updated = date_element.get('data-original-title').strip()
+    
+    exp_element = select_one(job_item, _EXPERIENCE)
+    experience = element_text(exp_element) if exp_element is not None else ''
+    
+    return {
+        'id': job_id,
+        'title': job_title,
+        'company_name': company_name,
+        'location': location,
+        'salary': salary,
+        'experience': experience,
+        'posted_date': posted_date,
+        'crawled_at': crawled_at,
+        'last_updated': last_updated,
+        'url': job_url,
+    }
+
+
+def extract_job_listings(html_content: Union[str, bytes, lxml.html.HtmlElement]) -> List[Dict[str, Any]]:
     try:
-        soup = BeautifulSoup(html_content, 'lxml')
-        job_items = soup.select('.job-item-search-result')
+        tree = parse_html(html_content)
+        job_items = _JOB_ITEMS(tree)
         
         if not job_items:
             logger.warning("No job items found in the page")
             return []
             
         jobs = []
-        for job_item in job_items:
-            try:
-                title_link = job_item.select_one('.title a')
+        crawled_at = datetime.now().isoformat()
 
-                if not title_link:
-                    continue
-                    
-                job_title = title_link.get_text(strip=True)
-                job_url = title_link.get('href', '')
-                
-                job_id = extract_job_id(job_url)
-                
-                company_element = job_item.select_one('.company-name')
-                company_name = company_element.get_text(strip=True) if company_element else ''
-                
-                location_element = job_item.select_one('.address')
-                location = location_element.get_text(strip=True) if location_element else ''
-                
-                salary_element = job_item.select_one('.title-salary')
-                salary = salary_element.get_text(strip=True) if salary_element else 'Thỏa thuận'
-
-                salary = re.sub(r'[\r\n\t]', ' ', salary)
-                salary = re.sub(r'\s+', ' ', salary).strip()
-                salary = re.sub(r'^[^a-zA-Z0-9]+', '', salary).strip()
-                
-                date_element = job_item.select_one('.label-update')
-                posted_date = ""
-                last_updated = ""
-                
-                if date_element:
-                    posted_date = date_element.get_text(strip=True)
-                    posted_date = re.sub(r'^Đăng', '', posted_date).strip()
-                    
-                    if date_element.has_attr('data-original-title'):
-                        last_updated = date_element['data-original-title'].strip()
-                
-                exp_element = job_item.select_one('.exp')
-                experience = exp_element.get_text(strip=True) if exp_element else ''
-                
-                job = {
-                    'id': job_id,
-                    'title': job_title,
-                    'company_name': company_name,
-                    'location': location,
-                    'salary': salary,
-                    'experience': experience,
-                    'posted_date': posted_date,
-                    'crawled_at': datetime.now().isoformat(),
-                }
-                
-                if last_updated:
-                    job['last_updated'] = last_updated
-
-                if job_url:
-                    job['url'] = job_url
+        for job_item in job_items:
+            job = _parse_one_item(job_item, crawled_at)
 
+            if job is not None:
                 jobs.append(job)
-            except Exception as e:
-                logger.error(f"Error parsing job item: {str(e)}")
-                continue
                 
         return jobs
     except Exception as e:
         logger.error(f"Error extracting job listings: {str(e)}")
-        return [] 
\ No newline at end of file
+        return []
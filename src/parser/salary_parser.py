@@ -1,27 +1,53 @@
 import re
 import logging
-from typing import Dict, Any
-from bs4 import Tag
+import lxml.html
+
+from typing import Dict, List, Any, Optional
+
+from src.parser.html_tools import list_item_texts
 
 logger = logging.getLogger(__name__)
 
+_NUMBER = r'\d+(?:[.,]\d{3})*(?:\.\d{1,2})?'
+
+_SALARY_RANGE_RE = re.compile(r'(' + _NUMBER + r')\s*-\s*(' + _NUMBER + r')\s*(triệu|tr|trieu|million|usd|vnd|đồng|dong)')
+_SALARY_SINGLE_RE = re.compile(r'(' + _NUMBER + r')\s*(triệu|tr|trieu|million|usd|vnd|đồng|dong)')
+
+
+def _parse_vn_number(number_text: str) -> float:
+    integer_part, point, fraction = number_text.rpartition('.')
+
+    if point and len(fraction) <= 2:
+        return float(integer_part.replace('.', '').replace(',', '') + '.' + fraction)
+
+    return float(number_text.replace('.', '').replace(',', ''))
+
+
+def _classify_salary_item(item_text: str) -> Optional[str]:
+    item_text = item_text.lower()
+
+    if 'lương cứng' in item_text or 'lương cơ bản' in item_text:
+        return 'base_salary'
+
+    if 'thu nhập' in item_text and 'kpi' in item_text:
+        return 'kpi_salary'
+
+    if 'hoa hồng' in item_text or 'commission' in item_text:
+        return 'commission'
+
+    return None
 
-def process_salary_info(content_element: Tag, salary_details: Dict[str, Any]) -> None:
-    salary_list_items = content_element.select('li')
 
-    if salary_list_items:
-        salary_info_items = []
+def process_salary_info(content_element: lxml.html.HtmlElement, salary_details: Dict[str, Any],
+                        item_texts: Optional[List[str]] = None) -> None:
+    salary_info_items = item_texts if item_texts is not None else list_item_texts(content_element)
 
-        for item in salary_list_items:
-            item_text = item.get_text(strip=True)
-            salary_info_items.append(item_text)
+    if salary_info_items:
+        for item_text in salary_info_items:
+            field = _classify_salary_item(item_text)
             
-            if 'lương cứng' in item_text.lower() or 'lương cơ bản' in item_text.lower():
-                salary_details['base_salary'] = item_text
-            elif 'thu nhập' in item_text.lower() and 'kpi' in item_text.lower():
-                salary_details['kpi_salary'] = item_text
-            elif 'hoa hồng' in item_text.lower() or 'commission' in item_text.lower():
-                salary_details['commission'] = item_text
+            if field:
+                salary_details[field] = item_text
         
         salary_details['items'] = salary_info_items
 
@@ -32,17 +58,17 @@ def process_general_salary(details: Dict[str, Any]) -> None:
     if 'thỏa thuận' in salary_text or 'thoả thuận' in salary_text:
         details['salary_negotiable'] = True
     
-    salary_range_match = re.search(r'(\d+(?:\.\d+)?)\s*-\s*(\d+(?:\.\d+)?)\s*(triệu|tr|trieu|million|usd|vnd|đồng|dong)', salary_text, re.IGNORECASE)
+    salary_range_match = _SALARY_RANGE_RE.search(salary_text)
 
     if salary_range_match:
-        details['salary_min'] = float(salary_range_match.group(1).replace('.', ''))
-        details['salary_max'] = float(salary_range_match.group(2).replace('.', ''))
-        details['salary_currency'] = salary_range_match.group(3).lower()
+        details['salary_min'] = _parse_vn_number(salary_range_match.group(1))
+        details['salary_max'] = _parse_vn_number(salary_range_match.group(2))
+        details['salary_currency'] = salary_range_match.group(3)
     else:
-        single_salary_match = re.search(r'(\d+(?:\.\d+)?)\s*(triệu|tr|trieu|million|usd|vnd|đồng|dong)', salary_text, re.IGNORECASE)
+        single_salary_match = _SALARY_SINGLE_RE.search(salary_text)
 
         if single_salary_match:
-            amount = float(single_salary_match.group(1).replace('.', ''))
+            amount = _parse_vn_number(single_salary_match.group(1))
             details['salary_min'] = amount
             details['salary_max'] = amount
-            details['salary_currency'] = single_salary_match.group(2).lower() 
\ No newline at end of file
+            details['salary_currency'] = single_salary_match.group(2) 
\ No newline at end of file
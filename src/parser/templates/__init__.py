@@ -1,4 +1,4 @@
-from src.parser.templates.detector import detect_template_type
+from src.parser.templates.detector import detect_template, detect_template_type
 from src.parser.templates.premium import parse_premium_template
 from src.parser.templates.standard import parse_standard_template
 from src.parser.templates.brand import parse_brand_template
@@ -6,6 +6,7 @@ from src.parser.templates.fallback import parse_fallback_template
 from src.parser.templates.common import finalize_job_details
 
 __all__ = [
+    'detect_template',
     'detect_template_type',
     'parse_premium_template',
     'parse_standard_template',
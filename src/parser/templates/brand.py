@@ -1,67 +1,89 @@
 import re
 import logging
-from bs4 import BeautifulSoup
-from typing import Dict, Any
+import lxml.html
 
-from src.parser.html_tools import parse_html_content
+from typing import Dict, List, Any, Optional
+from lxml.cssselect import CSSSelector
+
+from src.parser.html_tools import parse_html_content, list_item_texts, find_heading_and_content, element_text
 from src.parser.salary_parser import process_salary_info
-from src.parser.templates.common import finalize_job_details
+from src.parser.templates.common import finalize_job_details, classify_heading, heading_fields, section_found, all_sections_found, SALARY_SECTION
 
 logger = logging.getLogger(__name__)
 
+_SECTIONS = CSSSelector('.brand-job-detail-section')
+_INFO_BOXES = CSSSelector('.box-info-job')
+_SECTION_HEADING_TAGS = frozenset({'h2', 'h3'})
+_SECTION_HEADING_CLASSES = frozenset({'title'})
+_SECTION_CONTENT_CLASSES = frozenset({'content', 'desc', 'detail'})
+_DEADLINES = CSSSelector('.detail-deadline, .deadline-text, .job-deadline')
+_DATE_RE = re.compile(r'(\d{2}/\d{2}/\d{4})')
+
+_HEADING_MAP = (
+    ('mô tả', 'description'),
+    ('yêu cầu', 'requirements'),
+    ('quyền lợi', 'benefits'),
+    ('phúc lợi', 'benefits'),
+    ('địa điểm', 'work_location'),
+    ('lương', SALARY_SECTION),
+    ('thu nhập', SALARY_SECTION),
+)
+
+_FIELDS = heading_fields(_HEADING_MAP)
+
 
-def parse_brand_template(soup: BeautifulSoup, details: Dict[str, Any]) -> Dict[str, Any]:
+def parse_brand_template(tree: lxml.html.HtmlElement, details: Dict[str, Any],
+                         sections: Optional[List[lxml.html.HtmlElement]] = None) -> Dict[str, Any]:
     try:
-        job_sections = soup.select('.brand-job-detail-section')
+        job_sections = sections if sections is not None else _SECTIONS(tree)
 
         if not job_sections:
-            job_sections = soup.select('.box-info-job')
+            job_sections = _INFO_BOXES(tree)
         
         salary_details = {}
+        found_fields = set()
         
         for section in job_sections:
-            try:
-                heading = section.select_one('h2, h3, .title')
+            heading, content = find_heading_and_content(section, _SECTION_CONTENT_CLASSES, _SECTION_HEADING_TAGS,
+                                                        _SECTION_HEADING_CLASSES)
 
-                if not heading:
-                    continue
-                
-                heading_text = heading.get_text(strip=True).lower()
-                content = section.select_one('.content, .desc, .detail')
-                
-                if not content:
-                    continue
-                
-                content_text = parse_html_content(content)
-                
-                if 'mô tả' in heading_text:
-                    details['description'] = content_text
-                elif 'yêu cầu' in heading_text:
-                    details['requirements'] = content_text
-                elif 'quyền lợi' in heading_text or 'phúc lợi' in heading_text:
-                    details['benefits'] = content_text
-                elif 'địa điểm' in heading_text:
-                    details['work_location'] = content_text
-                elif 'lương' in heading_text or 'thu nhập' in heading_text:
-                    salary_details['full_text'] = content_text
-                    
-                    process_salary_info(content, salary_details)
-                
-            except Exception as e:
-                logger.error(f"Error parsing brand job section: {str(e)}")
+            if heading is None:
+                continue
+            
+            heading_text = element_text(heading).lower()
+            field = classify_heading(heading_text, _HEADING_MAP)
+
+            if field is None or section_found(found_fields, salary_details, field):
+                continue
+
+            if content is None:
                 continue
+            
+            item_texts = list_item_texts(content)
+            content_text = parse_html_content(content, item_texts)
+            
+            if field == SALARY_SECTION:
+                salary_details['full_text'] = content_text
+                
+                process_salary_info(content, salary_details, item_texts)
+            elif field:
+                details[field] = content_text
+                found_fields.add(field)
+
+            if all_sections_found(found_fields, salary_details, _FIELDS):
+                break
         
-        deadline_elements = soup.select('.detail-deadline, .deadline-text, .job-deadline')
+        deadline_elements = _DEADLINES(tree)
 
         for element in deadline_elements:
-            deadline_text = element.get_text(strip=True)
-            match = re.search(r'(\d{2}/\d{2}/\d{4})', deadline_text)
+            deadline_text = element_text(element)
+            match = _DATE_RE.search(deadline_text)
 
             if match:
                 details['application_deadline'] = match.group(1)
                 break
         
-        return finalize_job_details(soup, details, salary_details)
+        return finalize_job_details(tree, details, salary_details)
     except Exception as e:
         logger.error(f"Error parsing brand template: {str(e)}")
         return details 
\ No newline at end of file
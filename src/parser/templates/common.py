@@ -1,31 +1,59 @@
 import re
 import logging
 
-from bs4 import BeautifulSoup
-from typing import Dict, Any
-from datetime import datetime
+import lxml.html
 
+from typing import Dict, Any, FrozenSet, Optional, Sequence, Set, Tuple
+from lxml.cssselect import CSSSelector
+
+from src.parser.html_tools import select_one, element_text
 from src.parser.salary_parser import process_general_salary
 
 logger = logging.getLogger(__name__)
 
+_DEADLINE_LABEL = CSSSelector('.job-detail__information-detail--actions-label')
+_DEADLINE_RE = re.compile(r'Hạn nộp hồ sơ: (\d{2}/\d{2}/\d{4})')
+
+SALARY_SECTION = 'salary'
+
+
+def classify_heading(heading_text: str, heading_map: Sequence[Tuple[str, str]]) -> Optional[str]:
+    for keyword, field in heading_map:
+        if keyword in heading_text:
+            return field
+
+    return None
+
+
+def heading_fields(heading_map: Sequence[Tuple[str, str]]) -> FrozenSet[str]:
+    return frozenset(field for _, field in heading_map if field != SALARY_SECTION)
 
-def finalize_job_details(soup: BeautifulSoup, details: Dict[str, Any], salary_details: Dict[str, Any]) -> Dict[str, Any]:
+
+def section_found(found_fields: Set[str], salary_details: Dict[str, Any], field: str) -> bool:
+    if field == SALARY_SECTION:
+        return bool(salary_details)
+
+    return field in found_fields
+
+
+def all_sections_found(found_fields: Set[str], salary_details: Dict[str, Any], fields: FrozenSet[str]) -> bool:
+    return bool(salary_details) and fields <= found_fields
+
+
+def finalize_job_details(tree: lxml.html.HtmlElement, details: Dict[str, Any], salary_details: Dict[str, Any]) -> Dict[str, Any]:
     if salary_details:
         details['salary_details'] = salary_details
     
-    deadline_element = soup.select_one('.job-detail__information-detail--actions-label')
+    deadline_element = select_one(tree, _DEADLINE_LABEL)
 
-    if deadline_element:
-        deadline_text = deadline_element.get_text(strip=True)
+    if deadline_element is not None:
+        deadline_text = element_text(deadline_element)
 
-        match = re.search(r'Hạn nộp hồ sơ: (\d{2}/\d{2}/\d{4})', deadline_text)
+        match = _DEADLINE_RE.search(deadline_text)
 
         if match:
             details['application_deadline'] = match.group(1)
     
     process_general_salary(details)
     
-    details['crawled_at'] = datetime.now().isoformat()
-    
     return details 
\ No newline at end of file
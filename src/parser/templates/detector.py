@@ -1,18 +1,44 @@
 import logging
+import lxml.html
 
-from bs4 import BeautifulSoup
+from typing import List, Optional, Tuple
+from lxml.cssselect import CSSSelector
 
 logger = logging.getLogger(__name__)
 
+_PREMIUM_CLASS = 'premium-job-description__box'
+_STANDARD_CLASS = 'job-description__item'
+_BRAND_CLASS = 'brand-job-detail'
 
-def detect_template_type(soup: BeautifulSoup) -> str:
-    if soup.select_one('.premium-job-description__box'):
-        return "premium"
+_TEMPLATE_MARKERS = CSSSelector(f'.{_PREMIUM_CLASS}, .{_STANDARD_CLASS}, .{_BRAND_CLASS}')
+
+
+def detect_template(tree: lxml.html.HtmlElement) -> Tuple[str, Optional[List[lxml.html.HtmlElement]]]:
+    premium_boxes = []
+    standard_items = []
+    has_brand_marker = False
+
+    for marker in _TEMPLATE_MARKERS(tree):
+        classes = marker.get('class', '').split()
+
+        if _PREMIUM_CLASS in classes:
+            premium_boxes.append(marker)
+        elif _STANDARD_CLASS in classes:
+            standard_items.append(marker)
+        else:
+            has_brand_marker = True
+
+    if premium_boxes:
+        return "premium", premium_boxes
     
-    elif soup.select_one('.job-description__item'):
-        return "standard"
+    elif standard_items:
+        return "standard", standard_items
         
-    elif soup.select_one('.brand-job-detail'):
-        return "brand"
+    elif has_brand_marker:
+        return "brand", None
         
-    return "unknown"
\ No newline at end of file
+    return "unknown", None
+
+
+def detect_template_type(tree: lxml.html.HtmlElement) -> str:
+    return detect_template(tree)[0]
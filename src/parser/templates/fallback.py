@@ -1,59 +1,87 @@
 import re
 import logging
+import lxml.html
 
-from bs4 import BeautifulSoup
-from typing import Dict, Any
+from lxml import etree
+from typing import Dict, Iterable, Any, Optional
 
-from src.parser.html_tools import parse_html_content, find_content_after_heading
+from src.parser.html_tools import parse_html_content, list_item_texts, find_content_after_heading, element_text
 from src.parser.salary_parser import process_salary_info
-from src.parser.templates.common import finalize_job_details
+from src.parser.templates.common import finalize_job_details, classify_heading, SALARY_SECTION
 
 logger = logging.getLogger(__name__)
 
+_DEADLINE_TEXT_XPATH = etree.XPath(
+    "//text()[contains(translate(., 'HẠNỘPDEALI', 'hạnộpdeali'), 'hạn nộp')"
+    " or contains(translate(., 'HẠNỘPDEALI', 'hạnộpdeali'), 'deadline')]"
+)
+_DATE_RE = re.compile(r'(\d{2}/\d{2}/\d{4})')
 
-def parse_fallback_template(soup: BeautifulSoup, details: Dict[str, Any]) -> Dict[str, Any]:
+_HEADING_TAGS = ('h1', 'h2', 'h3', 'h4')
+
+_HEADING_MAP = (
+    ('mô tả', 'description'),
+    ('nhiệm vụ', 'description'),
+    ('yêu cầu', 'requirements'),
+    ('quyền lợi', 'benefits'),
+    ('phúc lợi', 'benefits'),
+    ('chế độ', 'benefits'),
+    ('địa điểm', 'work_location'),
+    ('nơi làm việc', 'work_location'),
+    ('lương', SALARY_SECTION),
+    ('thu nhập', SALARY_SECTION),
+)
+
+
+def _heading_level(heading: lxml.html.HtmlElement) -> str:
+    return heading.tag
+
+
+def parse_fallback_template(tree: lxml.html.HtmlElement, details: Dict[str, Any],
+                            headings: Optional[Iterable[lxml.html.HtmlElement]] = None) -> Dict[str, Any]:
     try:
         salary_details = {}
+
+        if headings is None:
+            headings = sorted(tree.iter(*_HEADING_TAGS), key=_heading_level)
         
-        for heading_tag in ['h1', 'h2', 'h3', 'h4']:
-            headings = soup.select(f'{heading_tag}')
+        for heading in headings:
+            heading_text = element_text(heading).lower()
+            field = classify_heading(heading_text, _HEADING_MAP)
+
+            if field is None:
+                continue
             
-            for heading in headings:
-                heading_text = heading.get_text(strip=True).lower()
-                
-                content = find_content_after_heading(heading)
+            content = find_content_after_heading(heading)
+            
+            if content is not None:
+                item_texts = list_item_texts(content)
+                content_text = parse_html_content(content, item_texts)
                 
-                if content:
-                    content_text = parse_html_content(content)
+                if field == SALARY_SECTION:
+                    salary_details['full_text'] = content_text
                     
-                    if 'mô tả' in heading_text or 'nhiệm vụ' in heading_text:
-                        details['description'] = content_text
-                    elif 'yêu cầu' in heading_text:
-                        details['requirements'] = content_text
-                    elif 'quyền lợi' in heading_text or 'phúc lợi' in heading_text or 'chế độ' in heading_text:
-                        details['benefits'] = content_text
-                    elif 'địa điểm' in heading_text or 'nơi làm việc' in heading_text:
-                        details['work_location'] = content_text
-                    elif 'lương' in heading_text or 'thu nhập' in heading_text:
-                        salary_details['full_text'] = content_text
-                        
-                        process_salary_info(content, salary_details)
+                    process_salary_info(content, salary_details, item_texts)
+                elif field:
+                    details[field] = content_text
         
-        deadline_pattern = re.compile(r'hạn nộp|deadline', re.IGNORECASE)
-        deadline_elements = soup.find_all(text=deadline_pattern)
+        deadline_elements = _DEADLINE_TEXT_XPATH(tree)
         
         for element in deadline_elements:
-            parent = element.parent
+            parent = element.getparent()
+
+            if element.is_tail and parent is not None:
+                parent = parent.getparent()
 
-            if parent:
-                deadline_text = parent.get_text(strip=True)
-                match = re.search(r'(\d{2}/\d{2}/\d{4})', deadline_text)
+            if parent is not None:
+                deadline_text = element_text(parent)
+                match = _DATE_RE.search(deadline_text)
 
                 if match:
                     details['application_deadline'] = match.group(1)
                     break
         
-        return finalize_job_details(soup, details, salary_details)
+        return finalize_job_details(tree, details, salary_details)
     except Exception as e:
         logger.error(f"Error parsing fallback template: {str(e)}")
         return details 
\ No newline at end of file
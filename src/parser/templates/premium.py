@@ -1,54 +1,69 @@
 import logging
+import lxml.html
 
-from bs4 import BeautifulSoup
-from typing import Dict, Any
+from typing import Dict, List, Any, Optional
+from lxml.cssselect import CSSSelector
 
-from src.parser.html_tools import parse_html_content
+from src.parser.html_tools import parse_html_content, list_item_texts, find_heading_and_content, element_text
 from src.parser.salary_parser import process_salary_info
-from src.parser.templates.common import finalize_job_details
+from src.parser.templates.common import finalize_job_details, classify_heading, heading_fields, section_found, all_sections_found, SALARY_SECTION
 
 logger = logging.getLogger(__name__)
 
+_BOXES = CSSSelector('.premium-job-description__box')
+_BOX_TITLE_CLASSES = frozenset({'premium-job-description__box--title'})
+_BOX_CONTENT_CLASSES = frozenset({'premium-job-description__box--content'})
 
-def parse_premium_template(soup: BeautifulSoup, details: Dict[str, Any]) -> Dict[str, Any]:
+_HEADING_MAP = (
+    ('mô tả công việc', 'description'),
+    ('yêu cầu', 'requirements'),
+    ('quyền lợi', 'benefits'),
+    ('địa điểm', 'work_location'),
+    ('thu nhập', SALARY_SECTION),
+    ('lương', SALARY_SECTION),
+)
+
+_FIELDS = heading_fields(_HEADING_MAP)
+
+
+def parse_premium_template(tree: lxml.html.HtmlElement, details: Dict[str, Any],
+                           boxes: Optional[List[lxml.html.HtmlElement]] = None) -> Dict[str, Any]:
     try:
-        job_description_boxes = soup.select('.premium-job-description__box')
+        job_description_boxes = boxes if boxes is not None else _BOXES(tree)
         
         salary_details = {}
+        found_fields = set()
         
         for box in job_description_boxes:
-            try:
-                heading = box.select_one('.premium-job-description__box--title')
-
-                if not heading:
-                    continue
-                    
-                heading_text = heading.get_text(strip=True).lower()
-                content = box.select_one('.premium-job-description__box--content')
-                
-                if not content:
-                    continue
-                
-                content_text = parse_html_content(content)
+            heading, content = find_heading_and_content(box, _BOX_CONTENT_CLASSES, heading_classes=_BOX_TITLE_CLASSES)
+
+            if heading is None:
+                continue
                 
-                if 'mô tả công việc' in heading_text:
-                    details['description'] = content_text
-                elif 'yêu cầu' in heading_text:
-                    details['requirements'] = content_text
-                elif 'quyền lợi' in heading_text:
-                    details['benefits'] = content_text
-                elif 'địa điểm' in heading_text:
-                    details['work_location'] = content_text
-                elif 'thu nhập' in heading_text or 'lương' in heading_text:
-                    salary_details['full_text'] = content_text
-                    
-                    process_salary_info(content, salary_details)
-                    
-            except Exception as e:
-                logger.error(f"Error parsing premium job description section: {str(e)}")
+            heading_text = element_text(heading).lower()
+            field = classify_heading(heading_text, _HEADING_MAP)
+
+            if field is None or section_found(found_fields, salary_details, field):
+                continue
+
+            if content is None:
                 continue
+            
+            item_texts = list_item_texts(content)
+            content_text = parse_html_content(content, item_texts)
+            
+            if field == SALARY_SECTION:
+                salary_details['full_text'] = content_text
+                
+                process_salary_info(content, salary_details, item_texts)
+            elif field:
+                details[field] = content_text
+                found_fields.add(field)
+
+            if all_sections_found(found_fields, salary_details, _FIELDS):
+                break
         
-        return finalize_job_details(soup, details, salary_details)
+        return finalize_job_details(tree, details, salary_details)
     except Exception as e:
         logger.error(f"Error parsing premium template: {str(e)}")
         return details 
\ No newline at end of file
@@ -1,70 +1,80 @@
 import logging
+import lxml.html
 
-from bs4 import BeautifulSoup
-from typing import Dict, Any
+from typing import Dict, List, Any, Optional
+from lxml.cssselect import CSSSelector
 
-from src.parser.html_tools import parse_html_content
+from src.parser.html_tools import parse_html_content, list_item_texts, find_heading_and_content, element_text
 from src.parser.salary_parser import process_salary_info
-from src.parser.templates.common import finalize_job_details
+from src.parser.templates.common import finalize_job_details, classify_heading, heading_fields, section_found, all_sections_found, SALARY_SECTION
 
 logger = logging.getLogger(__name__)
 
+_ITEMS = CSSSelector('.job-description__item')
+_ITEM_HEADING_TAGS = frozenset({'h3'})
+_ITEM_CONTENT_CLASSES = frozenset({'job-description__item--content'})
 
-def parse_standard_template(soup: BeautifulSoup, details: Dict[str, Any]) -> Dict[str, Any]:
+_SALARY_HEADING_MAP = (
+    ('thu nhập', SALARY_SECTION),
+    ('lương', SALARY_SECTION),
+)
+
+_HEADING_MAP = (
+    ('mô tả công việc', 'description'),
+    ('yêu cầu', 'requirements'),
+    ('quyền lợi', 'benefits'),
+    ('địa điểm làm việc', 'work_location'),
+    ('hạn nộp', 'application_deadline'),
+)
+
+_FIELDS = heading_fields(_HEADING_MAP)
+
+
+def parse_standard_template(tree: lxml.html.HtmlElement, details: Dict[str, Any],
+                            items: Optional[List[lxml.html.HtmlElement]] = None) -> Dict[str, Any]:
     try:
-        job_description_items = soup.select('.job-description__item')
+        job_description_items = items if items is not None else _ITEMS(tree)
         
         salary_details = {}
+        salary_found = False
+        found_fields = set()
         
-        salary_section = None
-
         for item in job_description_items:
-            heading = item.select_one('h3')
+            heading, content = find_heading_and_content(item, _ITEM_CONTENT_CLASSES, heading_tags=_ITEM_HEADING_TAGS)
 
-            if heading and ('thu nhập' in heading.get_text(strip=True).lower() or 'lương' in heading.get_text(strip=True).lower()):
-                salary_section = item
-                break
-        
-        if salary_section:
-            content = salary_section.select_one('.job-description__item--content')
-
-            if content:
-                salary_text = parse_html_content(content)
-                salary_details['full_text'] = salary_text
+            if heading is None:
+                continue
                 
-                process_salary_info(content, salary_details)
-        
-        for item in job_description_items:
-            try:
-                heading = item.select_one('h3')
+            heading_text = element_text(heading).lower()
+            is_salary = not salary_found and classify_heading(heading_text, _SALARY_HEADING_MAP) is not None
+            salary_found = salary_found or is_salary
+            field = classify_heading(heading_text, _HEADING_MAP)
+
+            if field is not None and section_found(found_fields, salary_details, field):
+                field = None
 
-                if not heading:
-                    continue
-                    
-                heading_text = heading.get_text(strip=True).lower()
-                content = item.select_one('.job-description__item--content')
+            if field is None and not is_salary:
+                continue
+
+            if content is None:
+                continue
+            
+            item_texts = list_item_texts(content)
+            content_text = parse_html_content(content, item_texts)
                 
-                if not content:
-                    continue
+            if field:
+                details[field] = content_text
+                found_fields.add(field)
+
+            if is_salary:
+                salary_details['full_text'] = content_text
                 
-                content_text = parse_html_content(content)
-                    
-                if 'mô tả công việc' in heading_text:
-                    details['description'] = content_text
-                elif 'yêu cầu' in heading_text:
-                    details['requirements'] = content_text
-                elif 'quyền lợi' in heading_text:
-                    details['benefits'] = content_text
-                elif 'địa điểm làm việc' in heading_text:
-                    details['work_location'] = content_text
-                elif 'hạn nộp' in heading_text:
-                    details['application_deadline'] = content_text
-                    
-            except Exception as e:
-                logger.error(f"Error parsing standard job description section: {str(e)}")
-                continue
+                process_salary_info(content, salary_details, item_texts)
+
+            if all_sections_found(found_fields, salary_details, _FIELDS):
+                break
         
-        return finalize_job_details(soup, details, salary_details)
+        return finalize_job_details(tree, details, salary_details)
     except Exception as e:
         logger.error(f"Error parsing standard template: {str(e)}")
         return details 
\ No newline at end of file
@@ -1,27 +1,46 @@
 import logging
-from typing import Dict, List, Any
+import functools
+from typing import Dict, List, Any, Optional, Tuple, Union
 
-from src.parser.details_parser import extract_job_details
+from src.parser.html_tools import parse_html
+from src.parser.details_parser import extract_job_details, extract_job_details_batch
 from src.parser.listing_parser import extract_job_listings
 from src.core.interfaces import ParserInterface
+from src.core.pagination import create_pagination_parser
 
 logger = logging.getLogger(__name__)
 
 
 class TopCVParser(ParserInterface):
-    def extract_job_listings(self, html_content: str) -> List[Dict[str, Any]]:
+    def __init__(self):
+        self.pagination_parser = create_pagination_parser('topcv')
+
+    def extract_job_listings(self, html_content: Union[str, bytes]) -> List[Dict[str, Any]]:
         return extract_job_listings(html_content)
+
+    def extract_job_listings_and_more(self, html_content: Union[str, bytes], page: int) -> Tuple[List[Dict[str, Any]], bool]:
+        tree = parse_html(html_content)
+
+        return extract_job_listings(tree), self.pagination_parser.has_more_pages(html_content, page, tree)
     
-    def extract_job_details(self, html_content: str, job_data: Dict[str, Any]) -> Dict[str, Any]:
-        return extract_job_details(html_content, job_data)
+    def extract_job_details(self, html_content: Union[str, bytes], job_data: Dict[str, Any],
+                            crawled_at: Optional[str] = None, copy: bool = False) -> Dict[str, Any]:
+        return extract_job_details(html_content, job_data, crawled_at, copy)
+
+    @staticmethod
+    def extract_job_details_batch(pairs: List[Tuple[Union[str, bytes], Dict[str, Any]]],
+                                  workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        return extract_job_details_batch(pairs, workers)
 
 
+_PARSERS = {
+    'topcv': TopCVParser,
+}
+
+
+@functools.lru_cache(maxsize=4)
 def create_parser(site_name: str) -> ParserInterface:
-    parsers = {
-        'topcv': TopCVParser(),
-    }
-    
-    if site_name.lower() in parsers:
-        return parsers[site_name.lower()]
+    if site_name.lower() in _PARSERS:
+        return _PARSERS[site_name.lower()]()
     else:
-        raise ValueError(f"Unsupported site: {site_name}") 
\ No newline at end of file
+        raise ValueError(f"Unsupported site: {site_name}")
@@ -2,5 +2,5 @@
 
 from src.utils.config import load_config
 from src.utils.config import configure_logging
-from src.utils.signal_handler import setup_signal_handlers, get_exit_flag
+from src.utils.signal_handler import setup_signal_handlers, get_exit_flag, wait_for_exit_signal
 from src.utils.filesystem import create_required_directories 
\ No newline at end of file
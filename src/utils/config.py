@@ -3,13 +3,18 @@ import yaml
 import logging
 from typing import Dict, Any
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 def load_config(config_path: str = 'config.yaml') -> Dict[str, Any]:
     try:
         if not os.path.exists(config_path):
             raise FileNotFoundError(f"Config file not found at {config_path}")
-            
+
         with open(config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=_YamlLoader)
             
         required_sections = ['crawling', 'output', 'logging', 'runtime']
         for section in required_sections:
@@ -3,10 +3,25 @@ import logging
 
 from typing import Dict, Any
 
+def jobs_jsonl_path(config: Dict[str, Any]) -> str:
+    output_config = config['output']
+
+    if 'jobs_jsonl' in output_config:
+        return output_config['jobs_jsonl']
+
+    if 'jobs_json' in output_config:
+        path = os.path.splitext(output_config['jobs_json'])[0] + '.jsonl'
+        logging.getLogger(__name__).warning(
+            f"output.jobs_json is deprecated, rename it to output.jobs_jsonl in your config (using {path})"
+        )
+        return path
+
+    raise ValueError("Missing 'jobs_jsonl' in the output section of the config file")
+
 def create_required_directories(config: Dict[str, Any]) -> None:
     logger = logging.getLogger(__name__)
     
-    os.makedirs(os.path.dirname(config['output']['jobs_json']), exist_ok=True)
+    os.makedirs(os.path.dirname(jobs_jsonl_path(config)), exist_ok=True)
     os.makedirs(os.path.dirname(config['output']['jobs_csv']), exist_ok=True)
     
     os.makedirs(os.path.dirname(config['logging']['log_file']), exist_ok=True)
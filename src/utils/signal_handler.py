@@ -1,16 +1,19 @@
 import signal
+import threading
 
-should_exit = False
+exit_event = threading.Event()
 
 
 def signal_handler(signum, frame) -> None:
-    global should_exit
     print(f"\nReceived signal {signum}. Exiting gracefully...")
-    should_exit = True
+    exit_event.set()
 
 def setup_signal_handlers() -> None:
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
 def get_exit_flag() -> bool:
-    return should_exit
\ No newline at end of file
+    return exit_event.is_set()
+
+def wait_for_exit_signal(timeout: float) -> bool:
+    return exit_event.wait(timeout)